@@ -3,72 +3,220 @@
 All-in-one CSV/JSON data processing tool.
 Supports: inspect, filter, sort, dedup, aggregate, join, convert, report, clean.
 No external dependencies — uses only Python 3 standard library.
+Optional: orjson, used for faster JSON/JSONL parsing and JSON output when installed.
 """
 
 import csv
 import json
+import math
+import os
+import re
 import sys
 import argparse
+import heapq
 from collections import defaultdict
+from itertools import chain
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson turns integers wider than 64 bits into floats; 19+ digit runs go to
+# the stdlib parser, which keeps them exact
+_LONG_DIGITS_RE = re.compile(rb'\d{19}')
+
+
+def json_loads(data):
+    """Parse JSON bytes, with orjson when installed.
+
+    Input orjson rejects (NaN, Infinity) or may not read exactly (very large
+    integers) is parsed by the json module, so both accept the same files.
+    """
+    if orjson is None or _LONG_DIGITS_RE.search(data):
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+# Lower-cased cell values normalized by the clean command
+EMPTY_VALUES = frozenset({'', 'n/a', 'na', 'null', 'none', '-', '#n/a', '#ref!'})
+TRUE_VALUES = frozenset({'true', 'yes', '1', 'y'})
+FALSE_VALUES = frozenset({'false', 'no', '0', 'n'})
 
 
 # ---------------------------------------------------------------------------
 # I/O helpers
 # ---------------------------------------------------------------------------
 
-def read_data(path, delimiter=None):
-    """Read CSV/TSV/JSON/JSONL into list of dicts."""
-    ext = path.rsplit('.', 1)[-1].lower() if '.' in path else ''
+def file_ext(path):
+    """Lower-cased file extension without the dot, or '' if there is none."""
+    return path.rsplit('.', 1)[-1].lower() if '.' in path else ''
+
+
+def iter_rows(path, delimiter=None):
+    """Yield rows from CSV/TSV/JSON/JSONL one dict at a time."""
+    ext = file_ext(path)
 
     if ext in ('json',):
-        with open(path, encoding='utf-8') as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            return [data]
+        with open(path, 'rb') as f:
+            data = json_loads(f.read())
+        if isinstance(data, list):
+            yield from data
+        else:
+            yield data
+        return
 
     if ext in ('jsonl', 'ndjson'):
-        rows = []
-        with open(path, encoding='utf-8') as f:
+        with open(path, 'rb') as f:
             for line in f:
                 line = line.strip()
                 if line:
-                    rows.append(json.loads(line))
-        return rows
+                    yield json_loads(line)
+        return
 
     # CSV / TSV
     if delimiter is None:
         delimiter = '\t' if ext == 'tsv' else ','
     with open(path, newline='', encoding='utf-8-sig') as f:
-        return list(csv.DictReader(f, delimiter=delimiter))
+        yield from csv.DictReader(f, delimiter=delimiter)
+
+
+def read_columns(path, cols, delimiter=None):
+    """Yield a tuple of the requested columns for each row.
+
+    CSV/TSV rows are read with csv.reader and indexed by position, so no
+    per-row dict is built. Unknown columns read as '' and cells missing from
+    short rows as None, matching what iter_rows would return.
+    """
+    ext = file_ext(path)
+    if ext in ('json', 'jsonl', 'ndjson'):
+        for r in iter_rows(path, delimiter):
+            yield tuple([r.get(c, '') for c in cols])
+        return
+
+    if delimiter is None:
+        delimiter = '\t' if ext == 'tsv' else ','
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        # Later duplicates win, as with DictReader
+        pos = {name: i for i, name in enumerate(header)}
+        idx = [pos.get(c) for c in cols]
+        for row in reader:
+            if not row:
+                continue
+            n = len(row)
+            yield tuple(['' if i is None else row[i] if i < n else None for i in idx])
+
+
+def read_data(path, delimiter=None):
+    """Read CSV/TSV/JSON/JSONL into list of dicts."""
+    return list(iter_rows(path, delimiter))
+
+
+def peek_rows(rows):
+    """Return (first_row, iterator) where the iterator still yields the first row."""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return None, iter(())
+    return first, chain([first], rows)
+
+
+def has_non_finite(obj):
+    """True if obj contains a NaN or infinite float anywhere in its values."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def orjson_dumps(obj, option=0):
+    """Serialize with orjson, or return None when json should write obj instead.
+
+    That covers values orjson cannot encode (integers wider than 64 bits) and
+    NaN/Infinity, which orjson would silently write as null.
+    """
+    if has_non_finite(obj):
+        return None
+    try:
+        return orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return None
 
 
 def write_data(rows, path, fmt=None, delimiter=None):
-    """Write list of dicts to CSV/JSON/JSONL/TSV."""
-    if not rows:
+    """Write an iterable of dicts to CSV/JSON/JSONL/TSV. Returns the row count."""
+    first, rows = peek_rows(rows)
+    if first is None:
         print("No rows to write.", file=sys.stderr)
-        return
+        return 0
 
     if fmt is None:
-        ext = path.rsplit('.', 1)[-1].lower() if '.' in path else 'csv'
-        fmt = ext
+        fmt = file_ext(path) or 'csv'
 
+    count = 0
     if fmt == 'json':
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(rows, f, indent=2, ensure_ascii=False)
+        rows = list(rows)
+        count = len(rows)
+        encoded = orjson_dumps(rows, orjson.OPT_INDENT_2) if orjson is not None else None
+        if encoded is not None:
+            with open(path, 'wb') as f:
+                f.write(encoded)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(rows, f, indent=2, ensure_ascii=False)
     elif fmt in ('jsonl', 'ndjson'):
         with open(path, 'w', encoding='utf-8') as f:
             for row in rows:
                 f.write(json.dumps(row, ensure_ascii=False) + '\n')
+                count += 1
     else:
         if delimiter is None:
             delimiter = '\t' if fmt == 'tsv' else ','
         with open(path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=rows[0].keys(), delimiter=delimiter)
-            writer.writeheader()
-            writer.writerows(rows)
+            count = write_csv(f, rows, list(first.keys()), delimiter)
+
+    print(f"Wrote {count} rows to {path}", file=sys.stderr)
+    return count
+
+
+def write_csv(f, rows, fieldnames, delimiter=','):
+    """Write a header and rows as CSV, looking fields up by a fixed column list.
+
+    Keys missing from a row are written empty; keys not in fieldnames are
+    dropped. Returns the row count.
+    """
+    count = 0
 
-    print(f"Wrote {len(rows)} rows to {path}", file=sys.stderr)
+    def values():
+        nonlocal count
+        for row in rows:
+            count += 1
+            get = row.get
+            yield [get(k, '') for k in fieldnames]
+
+    writer = csv.writer(f, delimiter=delimiter)
+    writer.writerow(fieldnames)
+    writer.writerows(values())
+    return count
+
+
+def write_stdout(rows, fieldnames):
+    """Stream rows to stdout as CSV. Returns the row count."""
+    return write_csv(sys.stdout, rows, list(fieldnames))
 
 
 def to_float(val, default=0.0):
@@ -76,11 +224,40 @@ def to_float(val, default=0.0):
     if val is None:
         return default
     try:
+        # float() already ignores surrounding whitespace, so strings (the
+        # common case for CSV cells) skip the str()/strip() round-trip.
+        if isinstance(val, str):
+            return float(val)
         return float(str(val).strip())
     except (ValueError, TypeError):
         return default
 
 
+def group_stats(pairs):
+    """Accumulate per-group stats in one pass over (group, value) pairs.
+
+    Returns ({group: [rows, count, sum, min, max]}, total_rows). Only
+    non-empty values contribute to count/sum/min/max.
+    """
+    groups = {}
+    total = 0
+    for name, raw in pairs:
+        total += 1
+        stats = groups.get(name)
+        if stats is None:
+            stats = groups[name] = [0, 0, 0.0, None, None]
+        stats[0] += 1
+        if str(raw).strip():
+            v = to_float(raw)
+            stats[1] += 1
+            stats[2] += v
+            if stats[3] is None or v < stats[3]:
+                stats[3] = v
+            if stats[4] is None or v > stats[4]:
+                stats[4] = v
+    return groups, total
+
+
 # ---------------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------------
@@ -103,36 +280,41 @@ def cmd_inspect(args):
 
 def cmd_filter(args):
     """Filter rows by a column condition."""
-    data = read_data(args.file)
+    first, rows = peek_rows(iter_rows(args.file))
     col = args.column
     op = args.op
     val = args.value
 
-    def match(row):
-        cell = str(row.get(col, '')).strip()
-        if op in ('gt', 'gte', 'lt', 'lte'):
-            cell_f = to_float(cell)
-            val_f = to_float(val)
-            if op == 'gt': return cell_f > val_f
-            if op == 'gte': return cell_f >= val_f
-            if op == 'lt': return cell_f < val_f
-            if op == 'lte': return cell_f <= val_f
-        if op == 'eq': return cell == val
-        if op == 'neq': return cell != val
-        if op == 'contains': return val.lower() in cell.lower()
-        if op == 'startswith': return cell.lower().startswith(val.lower())
-        if op == 'endswith': return cell.lower().endswith(val.lower())
-        return False
-
-    filtered = [r for r in data if match(r)]
-    print(f"Filtered: {len(filtered)}/{len(data)} rows match")
+    # Pick the comparison once; the comparison value is converted up front
+    val_f = to_float(val)
+    val_lo = val.lower()
+    predicates = {
+        'gt': lambda cell: to_float(cell) > val_f,
+        'gte': lambda cell: to_float(cell) >= val_f,
+        'lt': lambda cell: to_float(cell) < val_f,
+        'lte': lambda cell: to_float(cell) <= val_f,
+        'eq': lambda cell: cell == val,
+        'neq': lambda cell: cell != val,
+        'contains': lambda cell: val_lo in cell.lower(),
+        'startswith': lambda cell: cell.lower().startswith(val_lo),
+        'endswith': lambda cell: cell.lower().endswith(val_lo),
+    }
+    match = predicates[op]
+
+    total = 0
+
+    def filtered():
+        nonlocal total
+        for r in rows:
+            total += 1
+            if match(str(r.get(col, '')).strip()):
+                yield r
 
     if args.output:
-        write_data(filtered, args.output)
+        matched = write_data(filtered(), args.output)
     else:
-        writer = csv.DictWriter(sys.stdout, fieldnames=data[0].keys() if data else [])
-        writer.writeheader()
-        writer.writerows(filtered)
+        matched = write_stdout(filtered(), first.keys() if first else [])
+    print(f"Filtered: {matched}/{total} rows match", file=sys.stderr)
 
 
 def cmd_sort(args):
@@ -146,132 +328,204 @@ def cmd_sort(args):
     else:
         key_fn = lambda r: str(r.get(col, '')).strip().lower()
 
-    sorted_data = sorted(data, key=key_fn, reverse=reverse)
-    print(f"Sorted {len(sorted_data)} rows by '{col}' ({args.order})")
+    if args.top is not None:
+        # Partial heap selection: O(n log k), same order as sorted(...)[:k]
+        pick = heapq.nlargest if reverse else heapq.nsmallest
+        sorted_data = pick(args.top, data, key=key_fn)
+        print(f"Sorted {len(data)} rows by '{col}' ({args.order}), keeping top {len(sorted_data)}")
+    else:
+        sorted_data = sorted(data, key=key_fn, reverse=reverse)
+        print(f"Sorted {len(sorted_data)} rows by '{col}' ({args.order})")
 
     if args.output:
         write_data(sorted_data, args.output)
     else:
-        writer = csv.DictWriter(sys.stdout, fieldnames=data[0].keys() if data else [])
-        writer.writeheader()
-        writer.writerows(sorted_data)
+        write_stdout(sorted_data, data[0].keys() if data else [])
 
 
 def cmd_dedup(args):
     """Remove duplicate rows."""
-    data = read_data(args.file)
-    key_cols = [c.strip() for c in args.columns.split(',')] if args.columns else None
-
-    seen = set()
-    unique = []
-    for r in data:
-        if key_cols:
-            key = tuple(str(r.get(c, '')) for c in key_cols)
-        else:
-            key = tuple(sorted((k, str(v)) for k, v in r.items()))
-        if key not in seen:
-            seen.add(key)
-            unique.append(r)
-
-    removed = len(data) - len(unique)
-    print(f"Deduplicated: {len(unique)} unique rows ({removed} duplicates removed)")
+    first, rows = peek_rows(iter_rows(args.file))
+    if args.columns:
+        key_cols = [c.strip() for c in args.columns.split(',')]
+        full_row_cols = None
+    else:
+        # CSV rows share the first row's columns, so their values can be keyed
+        # in that order; JSON rows with other keys fall back to all items
+        key_cols = list(first.keys()) if first else []
+        full_row_cols = first.keys() if first else {}
+
+    total = 0
+
+    def unique():
+        nonlocal total
+        seen = set()
+        seen_add = seen.add
+        for r in rows:
+            total += 1
+            if full_row_cols is None or r.keys() == full_row_cols:
+                key = tuple([str(r.get(c, '')) for c in key_cols])
+            else:
+                key = frozenset([(k, str(v)) for k, v in r.items()])
+            if key not in seen:
+                seen_add(key)
+                yield r
 
     if args.output:
-        write_data(unique, args.output)
+        kept = write_data(unique(), args.output)
     else:
-        writer = csv.DictWriter(sys.stdout, fieldnames=data[0].keys() if data else [])
-        writer.writeheader()
-        writer.writerows(unique)
+        kept = write_stdout(unique(), first.keys() if first else [])
+    print(f"Deduplicated: {kept} unique rows ({total - kept} duplicates removed)", file=sys.stderr)
 
 
 def cmd_aggregate(args):
     """Group by a column and aggregate another."""
-    data = read_data(args.file)
     group_col = args.group_by
     agg_col = args.agg_column
     func = args.func
 
-    groups = defaultdict(list)
-    for r in data:
-        groups[r.get(group_col, '')].append(r)
+    groups, total = group_stats(read_columns(args.file, [group_col, agg_col]))
 
     results = []
     for name in sorted(groups):
-        group = groups[name]
-        values = [to_float(r.get(agg_col, '')) for r in group if str(r.get(agg_col, '')).strip()]
+        n_rows, n_vals, total_val, min_val, max_val = groups[name]
         if func == 'sum':
-            agg = sum(values)
+            agg = total_val
         elif func == 'avg':
-            agg = sum(values) / len(values) if values else 0
+            agg = total_val / n_vals if n_vals else 0
         elif func == 'count':
-            agg = len(values)
+            agg = n_vals
         elif func == 'min':
-            agg = min(values) if values else 0
+            agg = min_val if n_vals else 0
         elif func == 'max':
-            agg = max(values) if values else 0
+            agg = max_val if n_vals else 0
         else:
-            agg = sum(values)
+            agg = total_val
 
         results.append({
             group_col: name,
             f'{func}_{agg_col}': f'{agg:.2f}',
-            'count': str(len(group))
+            'count': str(n_rows)
         })
 
-    print(f"Aggregated {len(data)} rows into {len(results)} groups")
+    print(f"Aggregated {total} rows into {len(results)} groups")
 
     if args.output:
         write_data(results, args.output)
     else:
-        writer = csv.DictWriter(sys.stdout, fieldnames=results[0].keys() if results else [])
-        writer.writeheader()
-        writer.writerows(results)
+        write_stdout(results, results[0].keys() if results else [])
 
 
-def cmd_join(args):
-    """Join two datasets on a key column."""
-    left = read_data(args.left_file)
-    right = read_data(args.right_file)
-    on = args.on
-    how = args.how
+def merge_rows(left_row, right_row, on):
+    """Combine a left and right row, keeping the left row's join key."""
+    merged = dict(left_row)
+    for k, v in right_row.items():
+        if k != on:
+            merged[k] = v
+    return merged
+
 
+def hash_join(left, right, on, how):
+    """Join by indexing the right side in memory and streaming the left."""
     right_index = defaultdict(list)
-    right_cols = set()
+    right_cols = {}
     for r in right:
         right_index[str(r.get(on, ''))].append(r)
-        right_cols.update(r.keys())
-    right_cols.discard(on)
+        right_cols.update(dict.fromkeys(r))
+    right_cols.pop(on, None)
 
-    results = []
     for lr in left:
         key = str(lr.get(on, ''))
         if key in right_index:
             for rr in right_index[key]:
-                merged = dict(lr)
-                for k, v in rr.items():
-                    if k != on:
-                        merged[k] = v
-                results.append(merged)
+                yield merge_rows(lr, rr, on)
+        elif how == 'left':
+            merged = dict(lr)
+            for col in right_cols:
+                merged[col] = ''
+            yield merged
+
+
+class UnsortedInputError(ValueError):
+    """A --sorted join input is not in ascending key order."""
+
+
+def iter_sorted_keys(rows, on, label):
+    """Yield (key, row) pairs, raising UnsortedInputError if keys go backwards.
+
+    Keys are compared as exact, case-sensitive text, the same way they are
+    matched.
+    """
+    prev = None
+    for r in rows:
+        key = str(r.get(on, ''))
+        if prev is not None and key < prev:
+            raise UnsortedInputError(
+                f"{label} file is not sorted by '{on}' as case-sensitive text "
+                f"({key!r} after {prev!r}); run without --sorted")
+        prev = key
+        yield key, r
+
+
+def merge_join(left, right, on, how):
+    """Join two row streams already sorted by the join key.
+
+    Only the right rows sharing the current key are held in memory.
+    Columns for unmatched left-join rows come from the first right row.
+    """
+    first, right = peek_rows(right)
+    right_cols = [k for k in first if k != on] if first else []
+    right = iter_sorted_keys(right, on, 'right')
+    pending = next(right, None)
+    block_key, block = None, []
+
+    for key, lr in iter_sorted_keys(left, on, 'left'):
+        if key != block_key:
+            block_key, block = key, []
+            while pending is not None and pending[0] < key:
+                pending = next(right, None)
+            while pending is not None and pending[0] == key:
+                block.append(pending[1])
+                pending = next(right, None)
+        if block:
+            for rr in block:
+                yield merge_rows(lr, rr, on)
         elif how == 'left':
             merged = dict(lr)
             for col in right_cols:
                 merged[col] = ''
-            results.append(merged)
+            yield merged
 
-    print(f"Joined: {len(results)} rows ({how} join on '{on}')")
 
-    if args.output:
-        write_data(results, args.output)
+def cmd_join(args):
+    """Join two datasets on a key column."""
+    on = args.on
+    how = args.how
+    left = iter_rows(args.left_file)
+    right = iter_rows(args.right_file)
+
+    if args.sorted:
+        joined = merge_join(left, right, on, how)
     else:
-        if results:
-            writer = csv.DictWriter(sys.stdout, fieldnames=results[0].keys())
-            writer.writeheader()
-            writer.writerows(results)
+        joined = hash_join(left, right, on, how)
+
+    try:
+        if args.output:
+            count = write_data(joined, args.output)
+        else:
+            first, joined = peek_rows(joined)
+            count = write_stdout(joined, first.keys()) if first else 0
+    except UnsortedInputError as e:
+        # Don't leave a half-written join behind
+        if args.output and os.path.exists(args.output):
+            os.remove(args.output)
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Joined: {count} rows ({how} join on '{on}')", file=sys.stderr)
 
 
 def cmd_convert(args):
     """Convert between CSV, JSON, JSONL, TSV formats."""
-    data = read_data(args.file)
     fmt = args.to
     output = args.output
 
@@ -280,24 +534,21 @@ def cmd_convert(args):
         ext_map = {'json': 'json', 'jsonl': 'jsonl', 'csv': 'csv', 'tsv': 'tsv'}
         output = f"{base}.{ext_map.get(fmt, fmt)}"
 
-    write_data(data, output, fmt=fmt)
-    print(f"Converted {len(data)} rows to {fmt} format")
+    count = write_data(iter_rows(args.file), output, fmt=fmt)
+    print(f"Converted {count} rows to {fmt} format")
 
 
 def cmd_report(args):
     """Generate a Markdown summary report."""
-    data = read_data(args.file)
     group_col = args.group_by
     value_col = args.value_column
 
-    groups = defaultdict(list)
-    for r in data:
-        groups[r.get(group_col, '')].append(r)
+    groups, total = group_stats(read_columns(args.file, [group_col, value_col]))
 
     lines = [
         f"# Data Summary Report",
         f"",
-        f"**Total rows**: {len(data)}",
+        f"**Total rows**: {total}",
         f"**Grouped by**: {group_col}",
         f"**Value column**: {value_col}",
         "",
@@ -306,15 +557,15 @@ def cmd_report(args):
     ]
 
     for name in sorted(groups):
-        vals = [to_float(r.get(value_col, '')) for r in groups[name] if str(r.get(value_col, '')).strip()]
-        if vals:
+        _, n_vals, total_val, min_val, max_val = groups[name]
+        if n_vals:
             lines.append(
-                f"| {name} | {len(vals)} | {sum(vals):.2f} | {sum(vals)/len(vals):.2f} | {min(vals):.2f} | {max(vals):.2f} |"
+                f"| {name} | {n_vals} | {total_val:.2f} | {total_val/n_vals:.2f} | {min_val:.2f} | {max_val:.2f} |"
             )
         else:
             lines.append(f"| {name} | 0 | - | - | - | - |")
 
-    lines.extend(["", f"*Generated from {len(data)} rows*"])
+    lines.extend(["", f"*Generated from {total} rows*"])
     report = '\n'.join(lines)
 
     if args.output:
@@ -327,39 +578,48 @@ def cmd_report(args):
 
 def cmd_clean(args):
     """Clean common data quality issues."""
-    data = read_data(args.file)
-    cleaned = []
-
-    for r in data:
-        clean_row = {}
-        for k, v in r.items():
-            k = k.strip()
-            v = str(v).strip() if v is not None else ''
-            # Normalize empty values
-            if v.lower() in ('', 'n/a', 'na', 'null', 'none', '-', '#n/a', '#ref!'):
-                v = ''
-            # Normalize booleans
-            elif v.lower() in ('true', 'yes', '1', 'y'):
-                v = 'true'
-            elif v.lower() in ('false', 'no', '0', 'n'):
-                v = 'false'
-            clean_row[k] = v
-        cleaned.append(clean_row)
-
-    print(f"Cleaned {len(cleaned)} rows")
+    first, rows = peek_rows(iter_rows(args.file))
+
+    def cleaned():
+        for r in rows:
+            clean_row = {}
+            for k, v in r.items():
+                k = k.strip()
+                v = str(v).strip() if v is not None else ''
+                v_lower = v.lower()
+                # Normalize empty values
+                if v_lower in EMPTY_VALUES:
+                    v = ''
+                # Normalize booleans
+                elif v_lower in TRUE_VALUES:
+                    v = 'true'
+                elif v_lower in FALSE_VALUES:
+                    v = 'false'
+                clean_row[k] = v
+            yield clean_row
 
     if args.output:
-        write_data(cleaned, args.output)
+        count = write_data(cleaned(), args.output)
     else:
-        writer = csv.DictWriter(sys.stdout, fieldnames=data[0].keys() if data else [])
-        writer.writeheader()
-        writer.writerows(cleaned)
+        count = write_stdout(cleaned(), [k.strip() for k in first] if first else [])
+    print(f"Cleaned {count} rows", file=sys.stderr)
 
 
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
+def positive_int(text):
+    """argparse type for options that need a count of at least 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{text}'")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
 def main():
     parser = argparse.ArgumentParser(description='CSV/JSON Data Processing Tool')
     sub = parser.add_subparsers(dest='command', required=True)
@@ -382,6 +642,7 @@ def main():
     p.add_argument('--column', required=True, help='Column to sort by')
     p.add_argument('--order', default='asc', choices=['asc','desc'])
     p.add_argument('--numeric', action='store_true', help='Numeric sort')
+    p.add_argument('--top', type=positive_int, help='Only keep the first N rows after sorting')
     p.add_argument('--output', help='Output file path')
 
     # dedup
@@ -404,6 +665,9 @@ def main():
     p.add_argument('right_file', help='Right file path')
     p.add_argument('--on', required=True, help='Key column for join')
     p.add_argument('--how', default='inner', choices=['inner','left'])
+    p.add_argument('--sorted', action='store_true',
+                   help='Both files are already sorted by the key as case-sensitive text (not numerically); '
+                        'stream a merge join instead of indexing the right file')
     p.add_argument('--output', help='Output file path')
 
     # convert
@@ -0,0 +1,53 @@
+import math
+import os
+import tempfile
+import unittest
+
+from csv_tool import iter_rows, write_data
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestJsonRoundTrip(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def round_trip(self, rows, ext):
+        """Write rows to a temp file with the given extension and read them back"""
+        path = os.path.join(self.tmpdir.name, f"data.{ext}")
+        write_data(rows, path)
+        return list(iter_rows(path))
+
+    def test_nan_and_infinity_survive_json(self):
+        """NaN and +/-Infinity are written as such, not as null"""
+        for ext in ("json", "jsonl"):
+            with self.subTest(ext=ext):
+                rows = self.round_trip([{"a": 1, "b": math.nan, "c": math.inf, "d": -math.inf}], ext)
+                self.assertEqual(len(rows), 1)
+                self.assertTrue(math.isnan(rows[0]["b"]))
+                self.assertEqual(rows[0]["c"], math.inf)
+                self.assertEqual(rows[0]["d"], -math.inf)
+
+    def test_nested_nan_survives_json(self):
+        """Non-finite floats inside nested values are preserved too"""
+        rows = self.round_trip([{"a": {"b": [1.5, math.nan]}}], "json")
+        self.assertTrue(math.isnan(rows[0]["a"]["b"][1]))
+
+    def test_large_integers_survive_json(self):
+        """Integers wider than 64 bits are written and read back exactly"""
+        big = 123456789012345678901234567890
+        for ext in ("json", "jsonl"):
+            with self.subTest(ext=ext):
+                self.assertEqual(self.round_trip([{"a": big}], ext), [{"a": big}])
+
+    def test_finite_rows_unchanged(self):
+        """Ordinary rows round-trip unchanged"""
+        data = [{"name": "Zoë", "score": 1.25, "tags": ["x", None]}, {"name": "b", "score": 2}]
+        for ext in ("json", "jsonl"):
+            with self.subTest(ext=ext):
+                self.assertEqual(self.round_trip(data, ext), data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 """
 Read, write, format, and analyze Excel files (.xlsx).
 Dependencies: openpyxl
+Optional: python-calamine (faster analyze on large workbooks)
 """
 
 import argparse
@@ -9,54 +10,108 @@ import csv
 import json
 import os
 import sys
+import textwrap
+from itertools import chain, islice, zip_longest
 
 try:
     import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
     from openpyxl.utils import get_column_letter
+    from openpyxl.utils.exceptions import InvalidFileException
 except ImportError:
     print("Missing dependency: openpyxl", file=sys.stderr)
     print("Install with: pip install openpyxl", file=sys.stderr)
     sys.exit(1)
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# openpyxl style objects are immutable, so one instance can be shared by
+# every cell (and is stored once in the workbook's style table).
+_HEADER_FONT = Font(bold=True, color="FFFFFFFF", size=11)
+_HEADER_FILL = PatternFill(start_color="FF4472C4", end_color="FF4472C4", fill_type="solid")
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+_THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+_TITLE_FONT = Font(bold=True, size=14)
+_TITLE_ALIGN = Alignment(horizontal="center")
+_HEADER_STYLE = 'excel_tool header'
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def file_not_found(path):
+    """Report a missing input file and exit."""
+    print(f"Error: File not found: {path}", file=sys.stderr)
+    sys.exit(1)
+
+
+def open_workbook(path, **kwargs):
+    """Load a workbook, exiting with an error message if it can't be opened.
+
+    Missing files are detected from the failed open rather than a separate
+    stat() beforehand.
+    """
+    try:
+        return openpyxl.load_workbook(path, **kwargs)
+    except FileNotFoundError:
+        file_not_found(path)
+    except InvalidFileException as e:
+        if not os.path.isfile(path):
+            file_not_found(path)
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def auto_width(ws):
     """Auto-adjust column widths to fit content."""
-    for col in ws.columns:
-        max_len = 0
-        col_letter = get_column_letter(col[0].column)
-        for cell in col:
-            val = str(cell.value) if cell.value is not None else ''
-            max_len = max(max_len, len(val))
-        ws.column_dimensions[col_letter].width = min(max_len + 3, 50)
-
-
-def apply_header_style(ws):
-    """Apply professional header styling to the first row."""
-    header_font = Font(bold=True, color="FFFFFF", size=11)
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_align = Alignment(horizontal="center", vertical="center")
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    for cell in ws[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_align
-        cell.border = thin_border
+    max_lens = [0] * ws.max_column
+    for row in ws.iter_rows(values_only=True):
+        for i, val in enumerate(row):
+            if val is not None:
+                n = len(str(val))
+                if n > max_lens[i]:
+                    max_lens[i] = n
+    for i, max_len in enumerate(max_lens):
+        ws.column_dimensions[get_column_letter(i + 1)].width = min(max_len + 3, 50)
+
+
+def apply_header_style(ws, row=1):
+    """Apply professional header styling to a row (the first by default).
+
+    The look is registered once per workbook as a named style, so each cell
+    takes a single style assignment instead of four attribute updates.
+    """
+    wb = ws.parent
+    if _HEADER_STYLE not in wb.style_names:
+        wb.add_named_style(NamedStyle(
+            name=_HEADER_STYLE,
+            font=_HEADER_FONT,
+            fill=_HEADER_FILL,
+            alignment=_HEADER_ALIGN,
+            border=_THIN_BORDER
+        ))
+    for cell in ws[row]:
+        cell.style = _HEADER_STYLE
+
+
+def iter_csv_data(path):
+    """Yield CSV rows (header first) one list at a time."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        yield from csv.reader(f)
 
 
 def load_csv_data(path):
     """Load CSV file into list of lists (header + rows)."""
-    with open(path, newline='', encoding='utf-8-sig') as f:
-        return list(csv.reader(f))
+    return list(iter_csv_data(path))
 
 
 def load_json_data(path):
@@ -72,73 +127,144 @@ def load_json_data(path):
     return rows
 
 
+def load_all_sheet_values(path):
+    """Load every sheet as (name, rows of cell values).
+
+    Uses python-calamine's native reader when installed. Its rows may report
+    empty cells as '' and whole numbers as floats, which is fine for stats
+    but not for verbatim output, so cmd_read keeps openpyxl.
+    """
+    if CalamineWorkbook is not None:
+        try:
+            cwb = CalamineWorkbook.from_path(path)
+        except OSError:
+            if os.path.isfile(path):
+                raise
+            file_not_found(path)
+        sheets = []
+        for name in cwb.sheet_names:
+            rows = cwb.get_sheet_by_name(name).to_python(skip_empty_area=False)
+            if rows:
+                rows[0] = [int(h) if isinstance(h, float) and h.is_integer() else h for h in rows[0]]
+            sheets.append((name, rows))
+        return sheets
+
+    wb = open_workbook(path, read_only=True, data_only=True)
+    try:
+        return [(name, read_only_values(wb[name])) for name in wb.sheetnames]
+    finally:
+        wb.close()
+
+
+def read_only_values(ws):
+    """All cell values of a read-only worksheet, as rectangular rows.
+
+    Read-only mode trusts the sheet's stored <dimension>, which other apps can
+    leave stale (too large), so the size is taken from the cells that hold a
+    value instead. Trailing empty rows and columns are dropped, matching the
+    calamine path.
+    """
+    ws.reset_dimensions()
+    rows = list(ws.iter_rows(values_only=True))
+    while rows and all(v is None for v in rows[-1]):
+        rows.pop()
+
+    width = 0
+    for row in rows:
+        for i in range(len(row) - 1, width - 1, -1):
+            if row[i] is not None:
+                width = i + 1
+                break
+    return [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+
+
 # ---------------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------------
 
-def cmd_read(args):
-    """Read and display an Excel file."""
-    if not os.path.isfile(args.file):
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
-        sys.exit(1)
+def emit_json(rows, out):
+    """Write rows as a JSON array of objects keyed by the header row."""
+    headers = next(rows)
+    first = next(rows, None)
+    if first is None:
+        out.write(json.dumps([headers], indent=2, ensure_ascii=False))
+        return
+    # Same layout as json.dumps(records, indent=2), one record at a time
+    out.write('[')
+    sep = '\n'
+    for r in chain([first], rows):
+        out.write(sep)
+        out.write(textwrap.indent(json.dumps(dict(zip(headers, r)), indent=2, ensure_ascii=False), '  '))
+        sep = ',\n'
+    out.write('\n]')
+
+
+def emit_csv(rows, out):
+    """Write rows of raw cell values as CSV (csv.writer stringifies them)."""
+    csv.writer(out).writerows(
+        ['' if c is None else c for c in row] for row in rows
+    )
 
-    wb = openpyxl.load_workbook(args.file, data_only=True)
-    sheet_name = args.sheet or wb.active.title
-    if sheet_name not in wb.sheetnames:
-        print(f"Error: Sheet '{sheet_name}' not found. Available: {wb.sheetnames}", file=sys.stderr)
-        sys.exit(1)
 
-    ws = wb[sheet_name]
-    rows = []
-    for row in ws.iter_rows(values_only=True):
-        rows.append([str(c) if c is not None else '' for c in row])
+def emit_table(rows, out):
+    """Write rows as an aligned text table (needs all rows to size columns)."""
+    rows = list(rows)
+    n_cols = len(rows[0])
+    col_widths = [max(map(len, col)) for col in islice(zip_longest(*rows, fillvalue=''), n_cols)]
+    fmt = ' | '.join(f'{{:<{w}}}' for w in col_widths)
+    lines = [fmt.format(*rows[0]), '-+-'.join('-' * w for w in col_widths)]
+    for r in islice(rows, 1, None):
+        if len(r) >= n_cols:
+            lines.append(fmt.format(*r))
+        else:
+            lines.append(' | '.join(c.ljust(w) for c, w in zip(r, col_widths)))
+    out.write('\n'.join(lines))
 
-    if not rows:
-        print("(Empty sheet)")
-        return
 
-    fmt = args.format or 'table'
+def cmd_read(args):
+    """Read and display an Excel file."""
+    # read_only streams cells from the zip instead of building every Cell object
+    wb = open_workbook(args.file, read_only=True, data_only=True)
+    try:
+        sheet_name = args.sheet or wb.active.title
+        if sheet_name not in wb.sheetnames:
+            print(f"Error: Sheet '{sheet_name}' not found. Available: {wb.sheetnames}", file=sys.stderr)
+            sys.exit(1)
 
-    if fmt == 'json':
-        if len(rows) < 2:
-            output = json.dumps(rows, indent=2, ensure_ascii=False)
+        ws = wb[sheet_name]
+        rows = ws.iter_rows(values_only=True)
+        first = next(rows, None)
+        if first is None:
+            print("(Empty sheet)")
+            return
+        rows = chain([first], rows)
+
+        fmt = args.format or 'table'
+        if fmt == 'csv':
+            emit = emit_csv
         else:
-            headers = rows[0]
-            data = []
-            for r in rows[1:]:
-                data.append(dict(zip(headers, r)))
-            output = json.dumps(data, indent=2, ensure_ascii=False)
-    elif fmt == 'csv':
-        import io
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerows(rows)
-        output = buf.getvalue()
-    else:  # table
-        lines = []
-        if rows:
-            col_widths = [0] * len(rows[0])
-            for r in rows:
-                for i, c in enumerate(r):
-                    if i < len(col_widths):
-                        col_widths[i] = max(col_widths[i], len(c))
-            for ri, r in enumerate(rows):
-                line = ' | '.join(c.ljust(col_widths[i]) for i, c in enumerate(r) if i < len(col_widths))
-                lines.append(line)
-                if ri == 0:
-                    lines.append('-+-'.join('-' * w for w in col_widths))
-        output = '\n'.join(lines)
-
-    if args.save:
-        with open(args.save, 'w', encoding='utf-8') as f:
-            f.write(output)
-        print(f"Saved to: {args.save}", file=sys.stderr)
-    else:
-        print(output)
+            emit = emit_json if fmt == 'json' else emit_table
+            rows = ([str(c) if c is not None else '' for c in row] for row in rows)
+
+        if args.save:
+            # csv.writer emits its own \r\n line endings
+            newline = '' if fmt == 'csv' else None
+            with open(args.save, 'w', encoding='utf-8', newline=newline) as f:
+                emit(rows, f)
+            print(f"Saved to: {args.save}", file=sys.stderr)
+        else:
+            emit(rows, sys.stdout)
+            sys.stdout.write('\n')
+    finally:
+        wb.close()
 
 
 def cmd_create(args):
     """Create a new Excel file."""
+    if not (args.title or args.auto_width or args.header_style or args.freeze_header):
+        create_write_only(args)
+        return
+
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = args.sheet or 'Sheet1'
@@ -155,24 +281,17 @@ def cmd_create(args):
     if args.title and rows:
         ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=len(rows[0]))
         title_cell = ws.cell(row=1, column=1, value=args.title)
-        title_cell.font = Font(bold=True, size=14)
-        title_cell.alignment = Alignment(horizontal="center")
+        title_cell.font = _TITLE_FONT
+        title_cell.alignment = _TITLE_ALIGN
         start_row = 2
 
-    # Write data
-    for ri, row in enumerate(rows):
-        for ci, val in enumerate(row):
-            ws.cell(row=start_row + ri, column=ci + 1, value=val)
+    # Write data (append continues below the title row when there is one)
+    for row in rows:
+        ws.append(row)
 
     # Apply formatting
     if args.header_style and rows:
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        for ci in range(len(rows[0])):
-            cell = ws.cell(row=start_row, column=ci + 1)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center")
+        apply_header_style(ws, start_row)
 
     if args.auto_width:
         auto_width(ws)
@@ -184,13 +303,33 @@ def cmd_create(args):
     print(f"Created: {args.output} ({len(rows)} rows)")
 
 
+def create_write_only(args):
+    """Create an unformatted workbook, streaming rows straight to the file.
+
+    Write-only sheets cannot be styled, merged or measured afterwards, so
+    cmd_create only takes this path when no formatting option is set.
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title=args.sheet or 'Sheet1')
+
+    rows = []
+    if args.from_csv:
+        rows = iter_csv_data(args.from_csv)
+    elif args.from_json:
+        rows = load_json_data(args.from_json)
+
+    count = 0
+    for row in rows:
+        ws.append(row)
+        count += 1
+
+    wb.save(args.output)
+    print(f"Created: {args.output} ({count} rows)")
+
+
 def cmd_add_sheet(args):
     """Add a new sheet to an existing workbook."""
-    if not os.path.isfile(args.file):
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
-        sys.exit(1)
-
-    wb = openpyxl.load_workbook(args.file)
+    wb = open_workbook(args.file)
     sheet_name = args.sheet or 'NewSheet'
     ws = wb.create_sheet(title=sheet_name)
 
@@ -200,9 +339,8 @@ def cmd_add_sheet(args):
     elif args.from_json:
         rows = load_json_data(args.from_json)
 
-    for ri, row in enumerate(rows):
-        for ci, val in enumerate(row):
-            ws.cell(row=ri + 1, column=ci + 1, value=val)
+    for row in rows:
+        ws.append(row)
 
     if rows:
         apply_header_style(ws)
@@ -214,11 +352,7 @@ def cmd_add_sheet(args):
 
 def cmd_format(args):
     """Apply formatting to an existing Excel file."""
-    if not os.path.isfile(args.file):
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
-        sys.exit(1)
-
-    wb = openpyxl.load_workbook(args.file)
+    wb = open_workbook(args.file)
     ws = wb.active
 
     if args.auto_width:
@@ -239,19 +373,13 @@ def cmd_format(args):
 
 def cmd_analyze(args):
     """Analyze an Excel file and show summary statistics."""
-    if not os.path.isfile(args.file):
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
-        sys.exit(1)
-
-    wb = openpyxl.load_workbook(args.file, data_only=True)
+    sheets = load_all_sheet_values(args.file)
 
     print(f"File: {args.file}")
-    print(f"Sheets: {wb.sheetnames}")
+    print(f"Sheets: {[name for name, _ in sheets]}")
     print()
 
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        rows = list(ws.iter_rows(values_only=True))
+    for sheet_name, rows in sheets:
         if not rows:
             print(f"  [{sheet_name}] (empty)")
             continue
@@ -264,30 +392,44 @@ def cmd_analyze(args):
         headers = [str(h) if h else f'Col{i+1}' for i, h in enumerate(rows[0])]
         print(f"    Headers: {', '.join(headers)}")
 
-        # Basic stats for numeric columns
+        # Basic stats for numeric columns, accumulated in one pass over the rows
         if len(rows) > 1:
-            for ci, header in enumerate(headers):
-                values = []
-                for r in rows[1:]:
-                    if ci < len(r) and r[ci] is not None:
+            n_cols = len(headers)
+            stats = [None] * n_cols  # per column: [count, sum, min, max]
+            for r in rows[1:]:
+                for ci, v in enumerate(r[:n_cols]):
+                    # Cells come back as native numbers; only text (e.g. sheets
+                    # built from CSV) needs parsing
+                    if isinstance(v, (int, float)):
+                        f = v
+                    elif isinstance(v, str):
                         try:
-                            values.append(float(r[ci]))
-                        except (ValueError, TypeError):
-                            pass
-                if values:
-                    avg = sum(values) / len(values)
-                    print(f"    {header}: min={min(values):.2f}, max={max(values):.2f}, "
-                          f"avg={avg:.2f}, count={len(values)}")
+                            f = float(v)
+                        except ValueError:
+                            continue
+                    else:
+                        continue
+                    st = stats[ci]
+                    if st is None:
+                        stats[ci] = [1, f, f, f]
+                    else:
+                        st[0] += 1
+                        st[1] += f
+                        if f < st[2]:
+                            st[2] = f
+                        if f > st[3]:
+                            st[3] = f
+            for header, st in zip(headers, stats):
+                if st:
+                    count, total, lo, hi = st
+                    print(f"    {header}: min={lo:.2f}, max={hi:.2f}, "
+                          f"avg={total / count:.2f}, count={count}")
         print()
 
 
 def cmd_formula(args):
     """Add formulas to an Excel file."""
-    if not os.path.isfile(args.file):
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
-        sys.exit(1)
-
-    wb = openpyxl.load_workbook(args.file)
+    wb = open_workbook(args.file)
     ws = wb.active
 
     if args.cell:
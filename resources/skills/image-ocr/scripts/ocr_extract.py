@@ -8,6 +8,7 @@ System requirement: Tesseract OCR engine installed
 import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import pytesseract
@@ -18,6 +19,36 @@ except ImportError as e:
     print("Also install Tesseract OCR engine on your system.", file=sys.stderr)
     sys.exit(1)
 
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.tif', '.tiff', '.bmp', '.gif', '.webp'})
+
+
+class OCRError(Exception):
+    """An image could not be opened or recognized; str() is the message to show."""
+
+
+def otsu_threshold(histogram):
+    """Pick the gray level that best separates a 256-bin histogram (Otsu)."""
+    total = sum(histogram)
+    sum_all = sum(i * h for i, h in enumerate(histogram))
+    weight_bg = 0
+    sum_bg = 0
+    best_var = 0.0
+    threshold = 127
+    for level, count in enumerate(histogram):
+        weight_bg += count
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += level * count
+        mean_diff = sum_bg / weight_bg - (sum_all - sum_bg) / weight_fg
+        between_var = weight_bg * weight_fg * mean_diff * mean_diff
+        if between_var > best_var:
+            best_var = between_var
+            threshold = level
+    return threshold
+
 
 def preprocess_image(img, mode):
     """Apply preprocessing to improve OCR accuracy."""
@@ -25,23 +56,22 @@ def preprocess_image(img, mode):
         return img.convert('L')
     elif mode == 'threshold':
         gray = img.convert('L')
-        return gray.point(lambda x: 0 if x < 128 else 255, '1')
+        cutoff = otsu_threshold(gray.histogram())
+        lut = [0] * (cutoff + 1) + [255] * (255 - cutoff)
+        return gray.point(lut, '1')
     elif mode == 'blur':
         return img.filter(ImageFilter.MedianFilter(size=3))
     return img
 
 
-def extract_text(image_path, lang='eng', preprocess='none', dpi=None, psm=3):
-    """Extract text from an image file."""
-    if not os.path.isfile(image_path):
-        print(f"Error: File not found: {image_path}", file=sys.stderr)
-        sys.exit(1)
-
+def extract_text(image_path, lang='eng', preprocess='none', dpi=None, psm=3, oem=None):
+    """Extract text from an image file; raises OCRError on failure."""
     try:
         img = Image.open(image_path)
+    except FileNotFoundError:
+        raise OCRError(f"Error: File not found: {image_path}")
     except Exception as e:
-        print(f"Error opening image: {e}", file=sys.stderr)
-        sys.exit(1)
+        raise OCRError(f"Error opening image: {e}")
 
     # Apply preprocessing
     if preprocess != 'none':
@@ -49,6 +79,8 @@ def extract_text(image_path, lang='eng', preprocess='none', dpi=None, psm=3):
 
     # Build Tesseract config
     config_parts = [f'--psm {psm}']
+    if oem is not None:
+        config_parts.append(f'--oem {oem}')
     if dpi:
         config_parts.append(f'--dpi {dpi}')
     config = ' '.join(config_parts)
@@ -56,24 +88,75 @@ def extract_text(image_path, lang='eng', preprocess='none', dpi=None, psm=3):
     try:
         text = pytesseract.image_to_string(img, lang=lang, config=config)
     except pytesseract.TesseractNotFoundError:
-        print("Error: Tesseract OCR engine not found.", file=sys.stderr)
-        print("Install it:", file=sys.stderr)
-        print("  Windows: https://github.com/UB-Mannheim/tesseract/wiki", file=sys.stderr)
-        print("  macOS:   brew install tesseract", file=sys.stderr)
-        print("  Linux:   sudo apt install tesseract-ocr", file=sys.stderr)
-        sys.exit(1)
+        raise OCRError(
+            "Error: Tesseract OCR engine not found.\n"
+            "Install it:\n"
+            "  Windows: https://github.com/UB-Mannheim/tesseract/wiki\n"
+            "  macOS:   brew install tesseract\n"
+            "  Linux:   sudo apt install tesseract-ocr"
+        )
     except Exception as e:
-        print(f"OCR error: {e}", file=sys.stderr)
-        sys.exit(1)
+        raise OCRError(f"OCR error: {e}")
 
     return text.strip()
 
 
+def list_images(directory):
+    """Return image files directly inside a directory, sorted by name."""
+    if not os.path.isdir(directory):
+        print(f"Error: Directory not found: {directory}", file=sys.stderr)
+        sys.exit(1)
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+    )
+
+
+def extract_batch(image_paths, workers=None, **options):
+    """OCR several images concurrently.
+
+    pytesseract runs each recognition in its own tesseract process, so a
+    thread pool is enough to keep every core busy. OpenMP inside tesseract
+    is limited to one thread per process so the workers don't oversubscribe
+    the CPU. Returns (path, text, error) tuples in input order; for images
+    that failed, text is None and error is the OCRError.
+    """
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+    def run(path):
+        try:
+            return path, extract_text(path, **options), None
+        except OCRError as e:
+            return path, None, e
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return list(pool.map(run, image_paths))
+
+
+def positive_int(text):
+    """argparse type for options that need a count of at least 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{text}'")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Extract text from images using Tesseract OCR'
     )
-    parser.add_argument('image', help='Path to the image file')
+    parser.add_argument('image', nargs='?', help='Path to the image file')
+    parser.add_argument(
+        '--batch', metavar='DIR',
+        help='OCR every image in a directory instead of a single file'
+    )
+    parser.add_argument(
+        '--workers', type=positive_int, default=None,
+        help='Parallel OCR jobs for --batch (default: CPU count)'
+    )
     parser.add_argument(
         '--lang', default='eng',
         help='OCR language (default: eng). Examples: chi_sim, jpn, eng+chi_sim'
@@ -95,17 +178,48 @@ def main():
         '--psm', type=int, default=3,
         help='Tesseract page segmentation mode 0-13 (default: 3 = auto)'
     )
+    parser.add_argument(
+        '--oem', type=int, default=None, choices=[0, 1, 2, 3],
+        help='Tesseract OCR engine mode (1 = LSTM only; default: Tesseract default)'
+    )
 
     args = parser.parse_args()
+    if bool(args.image) == bool(args.batch):
+        parser.error('provide either an image path or --batch DIR')
 
-    text = extract_text(
-        args.image,
+    options = dict(
         lang=args.lang,
         preprocess=args.preprocess,
         dpi=args.dpi,
-        psm=args.psm
+        psm=args.psm,
+        oem=args.oem
     )
 
+    if args.batch:
+        image_paths = list_images(args.batch)
+        if not image_paths:
+            print(f"Error: No images found in {args.batch}", file=sys.stderr)
+            sys.exit(1)
+        results = extract_batch(image_paths, workers=args.workers, **options)
+        failed = 0
+        for path, _, error in results:
+            if error is not None:
+                failed += 1
+                print(f"{os.path.basename(path)}: {error}", file=sys.stderr)
+        text = '\n\n'.join(
+            f"=== {os.path.basename(path)} ===\n{t}"
+            for path, t, _ in results if t is not None
+        )
+        print(f"OCR: {len(results) - failed}/{len(results)} images processed", file=sys.stderr)
+        if failed == len(results):
+            sys.exit(1)
+    else:
+        try:
+            text = extract_text(args.image, **options)
+        except OCRError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+
     if not text:
         print("(No text detected in image)", file=sys.stderr)
         print("Tips: try --preprocess threshold, different --psm mode, or --lang option",
@@ -41,139 +41,188 @@ def check_dependencies():
         sys.exit(1)
 
 
-async def crawl_page(url, wait_seconds=3, css_selector=None, scroll=False):
-    """Crawl a page with headless browser and return Markdown content."""
-    from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
-    from crawl4ai.content_filter_strategy import PruningContentFilter
-    from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+# Scroll one viewport per animation frame so every lazy-load trigger is
+# passed, then stop once the page has stayed at the bottom for 500ms without
+# document.body.scrollHeight growing. Only height counts, so carousels, ads
+# and tickers that mutate the DOM without adding content don't hold it open
+SCROLL_JS = """
+async () => {
+    await new Promise((resolve) => {
+        let done = false;
+        let lastHeight = document.body.scrollHeight;
+        let lastChange = performance.now();
+        const finish = () => {
+            if (done) return;
+            done = true;
+            resolve();
+        };
+        const step = (now) => {
+            if (done) return;
+            const before = window.scrollY;
+            window.scrollBy({ top: window.innerHeight, behavior: "instant" });
+            const height = document.body.scrollHeight;
+            if (window.scrollY !== before || height > lastHeight) {
+                lastHeight = Math.max(lastHeight, height);
+                lastChange = now;
+            } else if (now - lastChange > 500) {
+                finish();
+                return;
+            }
+            requestAnimationFrame(step);
+        };
+        requestAnimationFrame(step);
+        // Safety timeout
+        setTimeout(finish, 15000);
+    });
+}
+"""
+
+
+# Request types aborted by --block-resources; scripts, XHR and documents
+# still load so JavaScript-rendered content is unaffected
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
 
-    browser_conf = BrowserConfig(
+
+def make_browser_config():
+    """Headless browser config shared by every page of a run."""
+    from crawl4ai import BrowserConfig
+
+    return BrowserConfig(
         headless=True,
         verbose=False,
     )
 
+
+def block_resources_hook():
+    """Build an on_page_context_created hook that aborts image, media and font requests."""
+    import weakref
+
+    routed = weakref.WeakSet()
+
+    async def route_request(route):
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def on_page_context_created(page, context, **kwargs):
+        # Pages can share a context; register the route once per context
+        if context not in routed:
+            routed.add(context)
+            await context.route("**/*", route_request)
+        return page
+
+    return on_page_context_created
+
+
+def make_run_config(wait_seconds=3, css_selector=None, scroll=False, use_cache=False):
+    """Build the per-page crawl config; one instance can be shared across pages."""
+    from crawl4ai import CrawlerRunConfig, CacheMode
+    from crawl4ai.content_filter_strategy import PruningContentFilter
+    from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+
     md_generator = DefaultMarkdownGenerator(
         content_filter=PruningContentFilter(threshold=0.4, threshold_type="fixed")
     )
 
     run_conf = CrawlerRunConfig(
-        cache_mode=CacheMode.BYPASS,
+        cache_mode=CacheMode.ENABLED if use_cache else CacheMode.BYPASS,
         markdown_generator=md_generator,
         page_timeout=60000,  # 60s
-        wait_until="networkidle",
+        js_code=SCROLL_JS if scroll else None,
+        # Content is usually ready long before ad/analytics traffic goes idle
+        wait_until="domcontentloaded",
     )
 
-    # Add wait time if specified
-    if wait_seconds > 0:
-        run_conf.delay_before_return_html = wait_seconds
-
-    # Wait for specific CSS selector
+    # Wait for a specific CSS selector, or fall back to a fixed delay
     if css_selector:
         run_conf.wait_for = f"css:{css_selector}"
+    elif wait_seconds > 0:
+        run_conf.delay_before_return_html = wait_seconds
 
-    async with AsyncWebCrawler(config=browser_conf) as crawler:
-        result = await crawler.arun(url=url, config=run_conf)
-
-        if not result.success:
-            return None, result.error_message or "Unknown error"
-
-        # Get the best available markdown
-        md = ""
-        if result.markdown:
-            if hasattr(result.markdown, 'fit_markdown') and result.markdown.fit_markdown:
-                md = result.markdown.fit_markdown
-            elif hasattr(result.markdown, 'raw_markdown') and result.markdown.raw_markdown:
-                md = result.markdown.raw_markdown
-            elif isinstance(result.markdown, str):
-                md = result.markdown
-
-        title = ""
-        if hasattr(result, 'metadata') and result.metadata:
-            title = result.metadata.get('title', '')
-
-        return {
-            "title": title,
-            "url": result.url or url,
-            "markdown": md,
-            "status_code": getattr(result, 'status_code', None),
-        }, None
-
-
-async def crawl_with_scroll(url, wait_seconds=3, css_selector=None):
-    """Crawl with infinite scroll support."""
-    from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
-    from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
-    from crawl4ai.content_filter_strategy import PruningContentFilter
+    return run_conf
 
-    browser_conf = BrowserConfig(
-        headless=True,
-        verbose=False,
-    )
 
-    # JavaScript to scroll to bottom
-    scroll_js = """
-    async () => {
-        await new Promise((resolve) => {
-            let totalHeight = 0;
-            const distance = 500;
-            const timer = setInterval(() => {
-                const scrollHeight = document.body.scrollHeight;
-                window.scrollBy(0, distance);
-                totalHeight += distance;
-                if (totalHeight >= scrollHeight) {
-                    clearInterval(timer);
-                    resolve();
-                }
-            }, 300);
-            // Safety timeout
-            setTimeout(() => { clearInterval(timer); resolve(); }, 15000);
-        });
-    }
-    """
+async def run_crawl(crawler, url, run_conf):
+    """Crawl one URL with an open crawler; returns (data, error)."""
+    result = await crawler.arun(url=url, config=run_conf)
 
-    md_generator = DefaultMarkdownGenerator(
-        content_filter=PruningContentFilter(threshold=0.4, threshold_type="fixed")
-    )
+    if not result.success:
+        return None, result.error_message or "Unknown error"
 
-    run_conf = CrawlerRunConfig(
-        cache_mode=CacheMode.BYPASS,
-        markdown_generator=md_generator,
-        page_timeout=60000,
-        js_code=scroll_js,
-        wait_until="networkidle",
-    )
+    # Get the best available markdown
+    md = ""
+    if result.markdown:
+        if hasattr(result.markdown, 'fit_markdown') and result.markdown.fit_markdown:
+            md = result.markdown.fit_markdown
+        elif hasattr(result.markdown, 'raw_markdown') and result.markdown.raw_markdown:
+            md = result.markdown.raw_markdown
+        elif isinstance(result.markdown, str):
+            md = result.markdown
 
-    if wait_seconds > 0:
-        run_conf.delay_before_return_html = wait_seconds
+    title = ""
+    if hasattr(result, 'metadata') and result.metadata:
+        title = result.metadata.get('title', '')
+
+    return {
+        "title": title,
+        "url": result.url or url,
+        "markdown": md,
+        "status_code": getattr(result, 'status_code', None),
+    }, None
 
-    if css_selector:
-        run_conf.wait_for = f"css:{css_selector}"
+
+async def crawl_many(urls, wait_seconds=3, css_selector=None, scroll=False, concurrency=4,
+                     block_resources=True, use_cache=False):
+    """Crawl several URLs with one shared browser, a few pages at a time.
+
+    Returns a list of (data, error) tuples in the same order as ``urls``.
+    """
+    from crawl4ai import AsyncWebCrawler
+
+    browser_conf = make_browser_config()
+    run_conf = make_run_config(wait_seconds, css_selector, scroll, use_cache)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def crawl_one(url, crawler):
+        async with semaphore:
+            try:
+                return await run_crawl(crawler, url, run_conf)
+            except Exception as e:
+                return None, str(e)
 
     async with AsyncWebCrawler(config=browser_conf) as crawler:
-        result = await crawler.arun(url=url, config=run_conf)
+        if block_resources:
+            crawler.crawler_strategy.set_hook("on_page_context_created", block_resources_hook())
+        return await asyncio.gather(*(crawl_one(url, crawler) for url in urls))
 
-        if not result.success:
-            return None, result.error_message or "Unknown error"
 
-        md = ""
-        if result.markdown:
-            if hasattr(result.markdown, 'fit_markdown') and result.markdown.fit_markdown:
-                md = result.markdown.fit_markdown
-            elif hasattr(result.markdown, 'raw_markdown') and result.markdown.raw_markdown:
-                md = result.markdown.raw_markdown
-            elif isinstance(result.markdown, str):
-                md = result.markdown
+def normalize_url(url):
+    """Strip whitespace and default to https:// when no scheme is given."""
+    url = url.strip()
+    if not url.startswith(("http://", "https://")):
+        url = "https://" + url
+    return url
 
-        title = ""
-        if hasattr(result, 'metadata') and result.metadata:
-            title = result.metadata.get('title', '')
 
-        return {
-            "title": title,
-            "url": result.url or url,
-            "markdown": md,
-            "status_code": getattr(result, 'status_code', None),
-        }, None
+def format_output(data, max_length=None):
+    """Render a crawl result as Markdown, truncated to max_length if given."""
+    parts = []
+    if data["title"]:
+        parts.append(f"# {data['title']}\n")
+    parts.append(f"**Source**: {data['url']}")
+    if data.get("status_code"):
+        parts.append(f"**Status**: {data['status_code']}")
+    parts.append("\n---\n")
+    parts.append(data["markdown"])
+
+    output = "\n".join(parts)
+
+    # Truncate if requested
+    if max_length and len(output) > max_length:
+        output = output[:max_length] + f"\n\n[... truncated at {max_length} characters, total {len(output)}]"
+
+    return output
 
 
 def main():
@@ -183,13 +232,22 @@ def main():
     parser = argparse.ArgumentParser(
         description="Crawl JavaScript-rendered pages with headless browser"
     )
-    parser.add_argument("url", help="URL to crawl")
+    parser.add_argument("urls", nargs="*", metavar="url", help="URL(s) to crawl")
+    parser.add_argument("--urls-file", type=str, default=None,
+                        help="File with one URL per line (crawled with a shared browser)")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Pages to crawl in parallel when given several URLs (default: 4)")
     parser.add_argument("--wait", type=int, default=3,
-                        help="Seconds to wait after page load (default: 3)")
+                        help="Seconds to wait after the DOM is ready for JS to finish; "
+                             "ignored when --selector is given (default: 3)")
     parser.add_argument("--selector", type=str, default=None,
                         help="CSS selector to wait for before extracting")
     parser.add_argument("--scroll", action="store_true",
                         help="Scroll to bottom to trigger lazy loading")
+    parser.add_argument("--block-resources", action=argparse.BooleanOptionalAction, default=True,
+                        help="Skip images, fonts and media while loading (default: on)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse Crawl4AI's local cache for pages crawled before")
     parser.add_argument("--save", type=str, default=None,
                         help="Also save output to this file path")
     parser.add_argument("--max-length", type=int, default=None,
@@ -197,49 +255,51 @@ def main():
 
     args = parser.parse_args()
 
-    url = args.url.strip()
-    if not url.startswith(("http://", "https://")):
-        url = "https://" + url
-
-    print(f"Crawling (dynamic): {url}", file=sys.stderr)
+    urls = list(args.urls)
+    if args.urls_file:
+        try:
+            with open(args.urls_file, encoding="utf-8") as f:
+                urls.extend(line.strip() for line in f
+                            if line.strip() and not line.lstrip().startswith("#"))
+        except OSError as e:
+            print(f"Error: cannot read URL file: {e}", file=sys.stderr)
+            sys.exit(1)
+    if not urls:
+        parser.error("at least one URL or --urls-file is required")
+    urls = [normalize_url(u) for u in urls]
+
+    for url in urls:
+        print(f"Crawling (dynamic): {url}", file=sys.stderr)
     print(f"Options: wait={args.wait}s, selector={args.selector}, scroll={args.scroll}", file=sys.stderr)
 
     # Run async crawl
-    if args.scroll:
-        data, error = asyncio.run(crawl_with_scroll(url, args.wait, args.selector))
-    else:
-        data, error = asyncio.run(crawl_page(url, args.wait, args.selector))
-
-    if error:
-        print(f"Error: crawl failed: {error}", file=sys.stderr)
+    results = asyncio.run(crawl_many(urls, args.wait, args.selector, args.scroll,
+                                     args.concurrency, args.block_resources, args.cache))
+
+    outputs = []
+    failures = 0
+    for url, (data, error) in zip(urls, results):
+        if error:
+            failures += 1
+            print(f"Error: crawl failed: {url}: {error}" if len(urls) > 1
+                  else f"Error: crawl failed: {error}", file=sys.stderr)
+            continue
+
+        if not data or not data["markdown"]:
+            print(f"Warning: no content extracted from page: {url}", file=sys.stderr)
+            outputs.append(f"[No content could be extracted from this page: {url}]"
+                           if len(urls) > 1 else "[No content could be extracted from this page]")
+            continue
+
+        outputs.append(format_output(data, args.max_length))
+        print(f"\nExtracted: {len(data['markdown'])} characters (dynamic crawl)", file=sys.stderr)
+
+    if failures == len(urls):
         sys.exit(1)
 
-    if not data or not data["markdown"]:
-        print("Warning: no content extracted from page", file=sys.stderr)
-        print("[No content could be extracted from this page]")
-        sys.exit(0)
-
-    # Build output
-    parts = []
-    if data["title"]:
-        parts.append(f"# {data['title']}\n")
-    parts.append(f"**Source**: {data['url']}")
-    if data.get("status_code"):
-        parts.append(f"**Status**: {data['status_code']}")
-    parts.append("\n---\n")
-    parts.append(data["markdown"])
-
-    output = "\n".join(parts)
-
-    # Truncate if requested
-    if args.max_length and len(output) > args.max_length:
-        output = output[:args.max_length] + f"\n\n[... truncated at {args.max_length} characters, total {len(output)}]"
-
+    output = "\n\n---\n\n".join(outputs)
     print(output)
 
-    content_len = len(data["markdown"])
-    print(f"\nExtracted: {content_len} characters (dynamic crawl)", file=sys.stderr)
-
     # Save to file if requested
     if args.save:
         try:
@@ -6,6 +6,8 @@ internal, external, or resource links. Useful for site navigation
 and discovery before deeper scraping.
 
 Dependencies: pip install requests beautifulsoup4
+Optional: pip install selectolax (faster anchor parsing on large pages),
+          orjson (faster --json output)
 """
 
 import sys
@@ -14,6 +16,11 @@ import json
 import re
 from urllib.parse import urlparse, urljoin
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def setup_encoding():
     """Setup proper encoding for Windows console output."""
@@ -55,17 +62,30 @@ RESOURCE_EXTENSIONS = {
     '.mp3', '.mp4', '.avi', '.mov', '.webm',
     '.css', '.js', '.woff', '.woff2', '.ttf', '.eot',
 }
+# str.endswith takes a tuple and checks every suffix in one call
+_RESOURCE_SUFFIXES = tuple(RESOURCE_EXTENSIONS)
+_WS_RE = re.compile(r'\s+')
+
+
+def site_suffix(domain):
+    """Return ".<last two labels>" of a domain, or None for single-label hosts."""
+    parts = domain.rsplit(".", 2)
+    if len(parts) < 2:
+        return None
+    return "." + ".".join(parts[-2:])
+
 
+def classify_link(href, base_domain, base_suffix=None):
+    """Classify a link as internal, external, or resource.
 
-def classify_link(href, base_domain):
-    """Classify a link as internal, external, or resource."""
+    ``base_suffix`` is site_suffix(base_domain); pass it in when classifying
+    many links against the same page.
+    """
     parsed = urlparse(href)
 
     # Check for resource files
-    path_lower = parsed.path.lower()
-    for ext in RESOURCE_EXTENSIONS:
-        if path_lower.endswith(ext):
-            return "resource"
+    if parsed.path.lower().endswith(_RESOURCE_SUFFIXES):
+        return "resource"
 
     # Check domain
     link_domain = parsed.netloc.lower()
@@ -73,26 +93,52 @@ def classify_link(href, base_domain):
         return "internal"
 
     # Check for common CDN / same-org subdomains
-    base_parts = base_domain.split(".")
-    link_parts = link_domain.split(".")
-    if len(base_parts) >= 2 and len(link_parts) >= 2:
-        if base_parts[-2:] == link_parts[-2:]:
-            return "internal"
+    if base_suffix is None:
+        base_suffix = site_suffix(base_domain)
+    if base_suffix and (link_domain.endswith(base_suffix) or "." + link_domain == base_suffix):
+        return "internal"
 
     return "external"
 
 
+def iter_anchors(html):
+    """Yield (href, text) for every <a href> in the page.
+
+    Uses selectolax's lexbor parser when installed, otherwise BeautifulSoup
+    (with lxml when available, which comes with readability-lxml).
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        LexborHTMLParser = None
+
+    if LexborHTMLParser is not None:
+        for a_tag in LexborHTMLParser(html).css("a[href]"):
+            yield a_tag.attributes.get("href") or "", a_tag.text(strip=True)
+        return
+
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    try:
+        import lxml  # noqa: F401
+        parser = "lxml"
+    except ImportError:
+        parser = "html.parser"
+    # Only <a href> elements are kept in the tree
+    soup = BeautifulSoup(html, parser, parse_only=SoupStrainer("a", href=True))
+    for a_tag in soup.find_all("a", href=True):
+        yield a_tag["href"], a_tag.get_text(strip=True)
+
+
 def extract_links(html, base_url):
     """Extract all links from HTML."""
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(html, "html.parser")
     base_domain = urlparse(base_url).netloc.lower()
+    base_suffix = site_suffix(base_domain)
     links = []
     seen = set()
 
-    for a_tag in soup.find_all("a", href=True):
-        href = a_tag["href"].strip()
+    for href, text in iter_anchors(html):
+        href = href.strip()
 
         # Skip anchors, javascript:, mailto:, tel:
         if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
@@ -107,12 +153,11 @@ def extract_links(html, base_url):
         seen.add(full_url)
 
         # Extract link text
-        text = a_tag.get_text(strip=True) or ""
-        text = re.sub(r'\s+', ' ', text)  # normalize whitespace
+        text = _WS_RE.sub(' ', text)  # normalize whitespace
         if len(text) > 100:
             text = text[:100] + "..."
 
-        link_type = classify_link(full_url, base_domain)
+        link_type = classify_link(full_url, base_domain, base_suffix)
 
         links.append({
             "url": full_url,
@@ -123,44 +168,38 @@ def extract_links(html, base_url):
     return links
 
 
-def format_markdown(links, url, filter_pattern=None, external_only=False):
-    """Format links as Markdown."""
-    # Apply filters
-    filtered = links
+def filter_links(links, filter_pattern=None, external_only=False):
+    """Apply the --external-only and --filter options to a list of links."""
     if external_only:
-        filtered = [link for link in filtered if link["type"] == "external"]
+        links = [link for link in links if link["type"] == "external"]
     if filter_pattern:
         try:
             pattern = re.compile(filter_pattern, re.IGNORECASE)
-            filtered = [link for link in filtered if pattern.search(link["url"])]
+            links = [link for link in links if pattern.search(link["url"])]
         except re.error as e:
             print(f"Warning: invalid regex pattern '{filter_pattern}': {e}", file=sys.stderr)
+    return links
 
-    # Group by type
-    internal = [link for link in filtered if link["type"] == "internal"]
-    external = [link for link in filtered if link["type"] == "external"]
-    resources = [link for link in filtered if link["type"] == "resource"]
 
-    parts = [f"# Links from {url}\n"]
-    parts.append(f"Total: **{len(filtered)}** links ({len(internal)} internal, {len(external)} external, {len(resources)} resource)\n")
+def format_markdown(links, url, filter_pattern=None, external_only=False):
+    """Format links as Markdown."""
+    filtered = filter_links(links, filter_pattern, external_only)
 
-    if internal:
-        parts.append("## Internal Links\n")
-        for lk in internal:
-            text = f" — {lk['text']}" if lk['text'] else ""
-            parts.append(f"- {lk['url']}{text}")
-        parts.append("")
+    # Group by type in a single pass
+    groups = {"internal": [], "external": [], "resource": []}
+    for link in filtered:
+        groups[link["type"]].append(link)
 
-    if external:
-        parts.append("## External Links\n")
-        for lk in external:
-            text = f" — {lk['text']}" if lk['text'] else ""
-            parts.append(f"- {lk['url']}{text}")
-        parts.append("")
+    parts = [f"# Links from {url}\n"]
+    parts.append(f"Total: **{len(filtered)}** links ({len(groups['internal'])} internal, "
+                 f"{len(groups['external'])} external, {len(groups['resource'])} resource)\n")
 
-    if resources:
-        parts.append("## Resource Links\n")
-        for lk in resources:
+    for title, link_type in (("Internal", "internal"), ("External", "external"), ("Resource", "resource")):
+        group = groups[link_type]
+        if not group:
+            continue
+        parts.append(f"## {title} Links\n")
+        for lk in group:
             text = f" — {lk['text']}" if lk['text'] else ""
             parts.append(f"- {lk['url']}{text}")
         parts.append("")
@@ -218,16 +257,13 @@ def main():
 
     if args.json:
         # Apply filters for JSON output too
-        filtered = links
-        if args.external_only:
-            filtered = [lk for lk in filtered if lk["type"] == "external"]
-        if args.filter:
-            try:
-                pattern = re.compile(args.filter, re.IGNORECASE)
-                filtered = [lk for lk in filtered if pattern.search(lk["url"])]
-            except re.error:
-                pass
-        print(json.dumps(filtered, indent=2, ensure_ascii=False))
+        filtered = filter_links(links, args.filter, args.external_only)
+        if orjson is not None:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(filtered, option=orjson.OPT_INDENT_2) + b"\n")
+            sys.stdout.buffer.flush()
+        else:
+            print(json.dumps(filtered, indent=2, ensure_ascii=False))
     else:
         print(format_markdown(links, final_url, args.filter, args.external_only))
 
@@ -6,11 +6,18 @@ fast extraction without a headless browser. Works well for articles, docs,
 blogs, wikis, and most static websites.
 
 Dependencies: pip install requests beautifulsoup4 readability-lxml html2text
+Optional: pip install selectolax (faster metadata and --selector extraction),
+          brotli (accept Brotli-compressed responses)
 """
 
 import sys
 import argparse
+import hashlib
+import json
+import operator
+import os
 import random
+import re
 import time
 from urllib.parse import urlparse
 
@@ -26,7 +33,6 @@ USER_AGENTS = [
 BASE_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "zh-CN,zh;q=0.9,en-US;q=0.8,en;q=0.7",
-    "Accept-Encoding": "gzip, deflate, br",
     "Cache-Control": "no-cache",
     "Pragma": "no-cache",
     "Upgrade-Insecure-Requests": "1",
@@ -49,12 +55,36 @@ ANTI_BOT_MARKERS = (
     "安全验证",
 )
 
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+
+HTML2TEXT_OPTIONS = {
+    "body_width": 0,  # Don't wrap lines
+    "ignore_images": False,
+    "ignore_links": False,
+    "ignore_emphasis": False,
+    "protect_links": True,
+    "unicode_snob": True,
+    "mark_code": True,
+    "wrap_links": False,
+    "single_line_break": False,
+}
+
+_BLANKLINE_RE = re.compile(r'\n{3,}')
+_METADATA_QUERY = "title, meta[name], meta[property]"
+
+# HTML requires <meta charset> to sit within the first 1024 bytes
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
 
 def build_headers(url: str):
+    from requests.utils import default_headers
+
     parsed = urlparse(url)
     scheme = parsed.scheme or "https"
     headers = dict(BASE_HEADERS)
     headers["User-Agent"] = random.choice(USER_AGENTS)
+    # Only advertise codings urllib3 can decode: br needs brotli installed
+    headers["Accept-Encoding"] = default_headers()["Accept-Encoding"]
 
     if parsed.netloc:
         headers["Host"] = parsed.netloc
@@ -77,6 +107,54 @@ def is_anti_bot_response(html: str, status_code: int) -> bool:
     return False
 
 
+def is_text_content_type(content_type: str) -> bool:
+    """True for HTML/XML/JSON/text responses (or when the server sent no type)."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if not media_type:
+        return True
+    return media_type.startswith("text/") or media_type.endswith(("/xml", "+xml", "/json", "+json"))
+
+
+def read_body(resp, max_bytes: int):
+    """Read a streamed response body, stopping after max_bytes.
+
+    Returns (body, truncated).
+    """
+    chunks = []
+    size = 0
+    for chunk in resp.iter_content(chunk_size=65536):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            return b"".join(chunks)[:max_bytes], True
+    return b"".join(chunks), False
+
+
+def decode_response(resp, body: bytes) -> str:
+    """Decode a response body, only sniffing the charset when nothing declares it.
+
+    A charset in the Content-Type header wins, then a <meta charset> in the
+    first 1024 bytes. Statistical detection (what requests' apparent_encoding
+    runs over the whole body) is the last resort.
+    """
+    if "charset=" in resp.headers.get("content-type", "").lower():
+        encoding = resp.encoding
+    else:
+        match = _META_CHARSET_RE.search(body[:1024])
+        if match:
+            encoding = match.group(1).decode("ascii")
+        else:
+            from requests.compat import chardet
+
+            detected = chardet.detect(body)["encoding"] if chardet is not None else "utf-8"
+            encoding = detected or resp.encoding
+
+    try:
+        return str(body, encoding or "utf-8", errors="replace")
+    except LookupError:
+        return str(body, "utf-8", errors="replace")
+
+
 def try_cloudscraper(url: str, headers: dict, timeout: int):
     try:
         import cloudscraper
@@ -97,10 +175,7 @@ def try_cloudscraper(url: str, headers: dict, timeout: int):
     except Exception:
         return None
 
-    if resp.encoding and resp.encoding.lower() != 'utf-8':
-        resp.encoding = resp.apparent_encoding or resp.encoding
-
-    return resp.text, resp.url, resp.status_code
+    return decode_response(resp, resp.content), resp.url, resp.status_code
 
 
 def setup_encoding():
@@ -145,8 +220,42 @@ def check_dependencies():
         sys.exit(1)
 
 
-def fetch_url(url, timeout=30, max_attempts=3):
-    """Fetch URL content, retrying through common anti-bot challenges."""
+def http_cache_path(cache_dir, url):
+    return os.path.join(cache_dir, "http", hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def load_http_cache(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_http_cache(path, resp, html):
+    """Remember the page and its validators so the next run can send a conditional GET."""
+    etag = resp.headers.get("etag")
+    last_modified = resp.headers.get("last-modified")
+    if not etag and not last_modified:
+        return
+    entry = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "url": resp.url,
+        "status": resp.status_code,
+        "html": html,
+    }
+    write_cache(path, json.dumps(entry, ensure_ascii=False))
+
+
+def fetch_url(url, timeout=30, max_attempts=3, max_bytes=DEFAULT_MAX_BYTES, cache_dir=None):
+    """Fetch URL content, retrying through common anti-bot challenges.
+
+    The body is streamed: non-text responses are rejected from their headers
+    and anything beyond max_bytes is never downloaded. With cache_dir, pages
+    that sent an ETag or Last-Modified are revalidated with a conditional GET
+    and reused on 304 Not Modified.
+    """
     import requests
     from requests.adapters import HTTPAdapter
     from urllib3.util.retry import Retry
@@ -165,31 +274,56 @@ def fetch_url(url, timeout=30, max_attempts=3):
     session.mount("https://", adapter)
 
     last_error = None
+    cache_file = http_cache_path(cache_dir, url) if cache_dir else None
+    cached = load_http_cache(cache_file) if cache_file else None
 
     for attempt in range(1, max_attempts + 1):
+        headers = build_headers(url)
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
         try:
             resp = session.get(
                 url,
-                headers=build_headers(url),
+                headers=headers,
                 timeout=timeout,
                 allow_redirects=True,
+                stream=True,
             )
+            if resp.status_code == 304 and cached:
+                resp.close()
+                print("Not modified: reusing cached page", file=sys.stderr)
+                return cached["html"], cached["url"], cached["status"]
+            content_type = resp.headers.get("content-type", "")
+            if not is_text_content_type(content_type):
+                resp.close()
+                print(
+                    f"Error: unsupported content type '{content_type}' (status {resp.status_code}); "
+                    "fetch_page.py only handles HTML and text pages",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            with resp:
+                body, truncated = read_body(resp, max_bytes)
         except requests.exceptions.Timeout as e:
             last_error = f"request timed out after {timeout}s"
             print(f"Warning: {last_error} (attempt {attempt}/{max_attempts})", file=sys.stderr)
             if attempt < max_attempts:
                 time.sleep(min(2 ** attempt, 4))
             continue
-        except requests.exceptions.ConnectionError as e:
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
             last_error = f"connection failed: {e}"
             print(f"Warning: {last_error} (attempt {attempt}/{max_attempts})", file=sys.stderr)
             if attempt < max_attempts:
                 time.sleep(min(2 ** attempt, 4))
             continue
 
-        if resp.encoding and resp.encoding.lower() != 'utf-8':
-            resp.encoding = resp.apparent_encoding or resp.encoding
-        html_text = resp.text
+        if truncated:
+            print(f"Warning: page exceeds {max_bytes} bytes, only the first {max_bytes} were read",
+                  file=sys.stderr)
+        html_text = decode_response(resp, body)
 
         anti_bot = is_anti_bot_response(html_text, resp.status_code)
 
@@ -201,6 +335,8 @@ def fetch_url(url, timeout=30, max_attempts=3):
                 break
 
         if not anti_bot:
+            if cache_file and not truncated:
+                save_http_cache(cache_file, resp, html_text)
             return html_text, resp.url, resp.status_code
 
         last_error = (
@@ -235,132 +371,162 @@ def extract_with_readability(html, url):
     return title, content_html
 
 
-def extract_with_selector(html, selector):
-    """Extract content matching a CSS selector."""
+def parse_html(html):
+    """Parse HTML once for CSS queries.
+
+    Returns a selectolax (lexbor) tree when selectolax is installed, otherwise
+    a BeautifulSoup tree built with lxml. The same tree serves both
+    extract_metadata and extract_with_selector.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(html, "lxml")
+    return LexborHTMLParser(html)
+
+
+def is_soup(tree):
+    """True if parse_html fell back to BeautifulSoup."""
     from bs4 import BeautifulSoup
 
-    soup = BeautifulSoup(html, "html.parser")
-    elements = soup.select(selector)
+    return isinstance(tree, BeautifulSoup)
+
+
+def extract_with_selector(tree, selector):
+    """Extract content matching a CSS selector from a parse_html tree."""
+    if is_soup(tree):
+        elements = tree.select(selector)
+        serialize = str
+    else:
+        elements = tree.css(selector)
+        serialize = operator.attrgetter("html")
     if not elements:
         return None
 
     # Combine all matching elements
-    parts = []
-    for el in elements:
-        parts.append(str(el))
-    return "\n".join(parts)
+    return "\n".join(map(serialize, elements))
 
 
 def html_to_markdown(html, base_url=None):
     """Convert HTML to clean Markdown."""
     import html2text
 
-    converter = html2text.HTML2Text()
-    converter.body_width = 0  # Don't wrap lines
-    converter.ignore_images = False
-    converter.ignore_links = False
-    converter.ignore_emphasis = False
-    converter.protect_links = True
-    converter.unicode_snob = True
-    converter.mark_code = True
-    converter.wrap_links = False
-    converter.single_line_break = False
-
-    if base_url:
-        converter.baseurl = base_url
+    # HTML2Text keeps parser state between handle() calls, so build a fresh one
+    converter = html2text.HTML2Text(baseurl=base_url or "")
+    for option, value in HTML2TEXT_OPTIONS.items():
+        setattr(converter, option, value)
 
     md = converter.handle(html)
 
     # Clean up excessive blank lines
-    import re
-    md = re.sub(r'\n{3,}', '\n\n', md)
+    md = _BLANKLINE_RE.sub('\n\n', md)
     return md.strip()
 
 
-def extract_metadata(html):
-    """Extract page metadata (title, description, etc.)."""
-    from bs4 import BeautifulSoup
+def extract_metadata(tree):
+    """Extract page metadata (title, description, etc.) from a parse_html tree.
+
+    All <title> and <meta> tags are collected in a single selector query and
+    then dispatched in Python; for each name/property the first tag in
+    document order wins.
+    """
+    if is_soup(tree):
+        nodes = tree.select(_METADATA_QUERY)
+        get_tag = lambda node: node.name  # noqa: E731
+        get_text = lambda node: node.get_text(strip=True)  # noqa: E731
+        get_attr = lambda node, attr: node.get(attr)  # noqa: E731
+    else:
+        nodes = tree.css(_METADATA_QUERY)
+        get_tag = lambda node: node.tag  # noqa: E731
+        get_text = lambda node: node.text(strip=True)  # noqa: E731
+        get_attr = lambda node, attr: node.attributes.get(attr)  # noqa: E731
+
+    title = None
+    by_name = {}
+    by_property = {}
+    for node in nodes:
+        if get_tag(node) == "title":
+            if title is None:
+                title = get_text(node)
+            continue
+        content = get_attr(node, "content")
+        name = get_attr(node, "name")
+        if name and name not in by_name:
+            by_name[name] = content
+        prop = get_attr(node, "property")
+        if prop and prop not in by_property:
+            by_property[prop] = content
 
-    soup = BeautifulSoup(html, "html.parser")
     meta = {}
 
     # Title
-    title_tag = soup.find("title")
-    if title_tag:
-        meta["title"] = title_tag.get_text(strip=True)
+    if title is not None:
+        meta["title"] = title
 
     # Meta description
-    desc_tag = soup.find("meta", attrs={"name": "description"})
-    if desc_tag and desc_tag.get("content"):
-        meta["description"] = desc_tag["content"].strip()
+    if by_name.get("description"):
+        meta["description"] = by_name["description"].strip()
 
     # OG tags
     for prop in ["og:title", "og:description", "og:type", "og:site_name"]:
-        tag = soup.find("meta", attrs={"property": prop})
-        if tag and tag.get("content"):
-            meta[prop.replace("og:", "og_")] = tag["content"].strip()
+        if by_property.get(prop):
+            meta[prop.replace("og:", "og_")] = by_property[prop].strip()
 
     # Author
-    author_tag = soup.find("meta", attrs={"name": "author"})
-    if author_tag and author_tag.get("content"):
-        meta["author"] = author_tag["content"].strip()
+    if by_name.get("author"):
+        meta["author"] = by_name["author"].strip()
 
     # Published date
     for attr in ["article:published_time", "datePublished", "date"]:
-        date_tag = soup.find("meta", attrs={"property": attr}) or soup.find("meta", attrs={"name": attr})
-        if date_tag and date_tag.get("content"):
-            meta["published"] = date_tag["content"].strip()
+        content = by_property[attr] if attr in by_property else by_name.get(attr)
+        if content:
+            meta["published"] = content.strip()
             break
 
     return meta
 
 
-def main():
-    setup_encoding()
-    check_dependencies()
-
-    parser = argparse.ArgumentParser(
-        description="Fetch a web page and extract content as Markdown"
-    )
-    parser.add_argument("url", help="URL to fetch")
-    parser.add_argument("--raw", action="store_true",
-                        help="Output full page Markdown (no readability extraction)")
-    parser.add_argument("--selector", type=str, default=None,
-                        help="CSS selector to extract specific elements")
-    parser.add_argument("--save", type=str, default=None,
-                        help="Also save output to this file path")
-    parser.add_argument("--max-length", type=int, default=None,
-                        help="Truncate output to N characters")
-    parser.add_argument("--timeout", type=int, default=30,
-                        help="Request timeout in seconds (default: 30)")
-    parser.add_argument("--max-attempts", type=int, default=3,
-                        help="Max HTTP attempts before giving up (default: 3)")
-    parser.add_argument("--no-metadata", action="store_true",
-                        help="Skip metadata header in output")
+def cache_path(cache_dir, html, url, *options):
+    """Path of the cached Markdown for this page body, URL and output options."""
+    digest = hashlib.sha1()
+    for part in (html, url, *options):
+        digest.update(str(part).encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return os.path.join(cache_dir, digest.hexdigest() + ".md")
 
-    args = parser.parse_args()
 
-    # Normalize URL
-    url = args.url.strip()
-    if not url.startswith(("http://", "https://")):
-        url = "https://" + url
+def read_cache(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
 
-    print(f"Fetching: {url}", file=sys.stderr)
 
-    # Fetch
-    html, final_url, status = fetch_url(url, timeout=args.timeout, max_attempts=args.max_attempts)
-    print(f"Status: {status}, Size: {len(html)} bytes", file=sys.stderr)
+def write_cache(path, text):
+    """Write a cache entry; failures only cost the next run a re-conversion."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: could not write cache: {e}", file=sys.stderr)
 
-    if final_url != url:
-        print(f"Redirected to: {final_url}", file=sys.stderr)
 
-    # Extract metadata
-    meta = extract_metadata(html) if not args.no_metadata else {}
+def render_page(html, final_url, args):
+    """Turn the fetched HTML into the Markdown output; returns (output, content_md)."""
+    # Metadata and --selector share one parse; readability parses on its own
+    tree = parse_html(html) if args.selector or not args.no_metadata else None
+    meta = extract_metadata(tree) if not args.no_metadata else {}
 
     # Extract content
     if args.selector:
         # CSS selector mode
-        selected_html = extract_with_selector(html, args.selector)
+        selected_html = extract_with_selector(tree, args.selector)
         if not selected_html:
             print(f"Warning: no elements matched selector '{args.selector}'", file=sys.stderr)
             print(f"[No elements matched CSS selector: {args.selector}]")
@@ -394,7 +560,66 @@ def main():
 
     parts.append(content_md)
 
-    output = "\n".join(parts)
+    return "\n".join(parts), content_md
+
+
+def main():
+    setup_encoding()
+    check_dependencies()
+
+    parser = argparse.ArgumentParser(
+        description="Fetch a web page and extract content as Markdown"
+    )
+    parser.add_argument("url", help="URL to fetch")
+    parser.add_argument("--raw", action="store_true",
+                        help="Output full page Markdown (no readability extraction)")
+    parser.add_argument("--selector", type=str, default=None,
+                        help="CSS selector to extract specific elements")
+    parser.add_argument("--save", type=str, default=None,
+                        help="Also save output to this file path")
+    parser.add_argument("--max-length", type=int, default=None,
+                        help="Truncate output to N characters")
+    parser.add_argument("--timeout", type=int, default=30,
+                        help="Request timeout in seconds (default: 30)")
+    parser.add_argument("--max-attempts", type=int, default=3,
+                        help="Max HTTP attempts before giving up (default: 3)")
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES,
+                        help=f"Stop downloading after N bytes of body (default: {DEFAULT_MAX_BYTES})")
+    parser.add_argument("--no-metadata", action="store_true",
+                        help="Skip metadata header in output")
+    parser.add_argument("--cache-dir", type=str, default=None,
+                        help="Cache pages and converted Markdown here, revalidating with "
+                             "ETag/Last-Modified (e.g. ~/.cache/opencowork/fetch_page)")
+
+    args = parser.parse_args()
+
+    # Normalize URL
+    url = args.url.strip()
+    if not url.startswith(("http://", "https://")):
+        url = "https://" + url
+
+    print(f"Fetching: {url}", file=sys.stderr)
+
+    # Fetch
+    cache_dir = os.path.expanduser(args.cache_dir) if args.cache_dir else None
+    html, final_url, status = fetch_url(url, timeout=args.timeout, max_attempts=args.max_attempts,
+                                        max_bytes=args.max_bytes, cache_dir=cache_dir)
+    print(f"Status: {status}, Size: {len(html)} bytes", file=sys.stderr)
+
+    if final_url != url:
+        print(f"Redirected to: {final_url}", file=sys.stderr)
+
+    cached_file = None
+    if cache_dir:
+        cached_file = cache_path(cache_dir, html, final_url, args.raw, args.selector, args.no_metadata)
+    cached = read_cache(cached_file) if cached_file else None
+    if cached is not None:
+        print("Cache hit: reusing converted Markdown", file=sys.stderr)
+        output, content_md = cached, None
+    else:
+        output, content_md = render_page(html, final_url, args)
+        if cached_file:
+            write_cache(cached_file, output)
 
     # Truncate if requested
     if args.max_length and len(output) > args.max_length:
@@ -403,8 +628,8 @@ def main():
     # Print to stdout
     print(output)
 
-    content_length = len(content_md)
-    print(f"\nExtracted: {content_length} characters", file=sys.stderr)
+    if content_md is not None:
+        print(f"\nExtracted: {len(content_md)} characters", file=sys.stderr)
 
     # Save to file if requested
     if args.save: